@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019-2021 The kikuchipy developers
+#
+# This file is part of kikuchipy.
+#
+# kikuchipy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# kikuchipy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with kikuchipy. If not, see <http://www.gnu.org/licenses/>.
+
+"""Private tools for computing EBSD detector quantities for many
+projection centers (PCs) in one pass.
+"""
+
+import numba as nb
+import numpy as np
+
+
+# Minimum number of PCs for which the Numba functions below are used
+# instead of the NumPy expressions in EBSDDetector
+NUMBA_MIN_NAVIGATION_SIZE = 1024
+
+
+@nb.jit(
+    "float64[:, :](float64[:, :], float64)",
+    nogil=True,
+    nopython=True,
+    parallel=True,
+    cache=True,
+)
+def _gnomonic_bounds(pc: np.ndarray, aspect_ratio: float) -> np.ndarray:
+    """Return the detector bounds [x0, x1, y0, y1] in gnomonic
+    coordinates per PC.
+
+    Parameters
+    ----------
+    pc
+        PCs in the Bruker convention in an array of shape (n, 3).
+    aspect_ratio
+        Number of detector rows divided by columns.
+
+    Returns
+    -------
+    gnomonic_bounds
+        Gnomonic bounds in an array of shape (n, 4).
+    """
+    n = pc.shape[0]
+    gnomonic_bounds = np.empty((n, 4))
+    for i in nb.prange(n):
+        pcx = pc[i, 0]
+        pcy = pc[i, 1]
+        pcz = pc[i, 2]
+        gnomonic_bounds[i, 0] = -aspect_ratio * pcx / pcz
+        gnomonic_bounds[i, 1] = aspect_ratio * (1 - pcx) / pcz
+        gnomonic_bounds[i, 2] = -(1 - pcy) / pcz
+        gnomonic_bounds[i, 3] = pcy / pcz
+    return gnomonic_bounds
+
+
+@nb.jit(
+    "float64[:](float64[:, :], float64)",
+    nogil=True,
+    nopython=True,
+    parallel=True,
+    cache=True,
+)
+def _r_max(pc: np.ndarray, aspect_ratio: float) -> np.ndarray:
+    """Return the maximum distance from the PC to the detector corners
+    in gnomonic coordinates per PC.
+
+    Parameters
+    ----------
+    pc
+        PCs in the Bruker convention in an array of shape (n, 3).
+    aspect_ratio
+        Number of detector rows divided by columns.
+
+    Returns
+    -------
+    r_max
+        Maximum distances in an array of shape (n,).
+    """
+    n = pc.shape[0]
+    r_max = np.empty(n)
+    for i in nb.prange(n):
+        pcx = pc[i, 0]
+        pcy = pc[i, 1]
+        pcz = pc[i, 2]
+        x_min2 = (aspect_ratio * pcx / pcz) ** 2
+        x_max2 = (aspect_ratio * (1 - pcx) / pcz) ** 2
+        y_min2 = ((1 - pcy) / pcz) ** 2
+        y_max2 = (pcy / pcz) ** 2
+        r_max[i] = np.sqrt(max(x_min2, x_max2) + max(y_min2, y_max2))
+    return r_max
+
+
+@nb.jit(
+    "float64[:, :](float64[:, :], float64[:], float64[:], float64[:, :])",
+    nogil=True,
+    nopython=True,
+    parallel=True,
+    cache=True,
+)
+def _pc_bruker2emsoft(
+    pc: np.ndarray, scale: np.ndarray, offset: np.ndarray, out: np.ndarray
+) -> np.ndarray:
+    """Convert PCs from the Bruker to the EMsoft convention, so that
+    emsoft = (bruker - offset) * scale.
+
+    Parameters
+    ----------
+    pc
+        PCs in the Bruker convention in an array of shape (n, 3).
+    scale, offset
+        Factor and offset per PC coordinate, of shape (3,).
+    out
+        Array of shape (n, 3) to write the converted PCs into.
+
+    Returns
+    -------
+    out
+        PCs in the EMsoft convention.
+    """
+    for i in nb.prange(pc.shape[0]):
+        for j in range(3):
+            out[i, j] = (pc[i, j] - offset[j]) * scale[j]
+    return out
+
+
+@nb.jit(
+    "float64[:, :](float64[:, :], float64[:], float64[:], float64[:, :])",
+    nogil=True,
+    nopython=True,
+    parallel=True,
+    cache=True,
+)
+def _pc_emsoft2bruker(
+    pc: np.ndarray, scale: np.ndarray, offset: np.ndarray, out: np.ndarray
+) -> np.ndarray:
+    """Convert PCs from the EMsoft to the Bruker convention, so that
+    bruker = emsoft / scale + offset.
+
+    Parameters
+    ----------
+    pc
+        PCs in the EMsoft convention in an array of shape (n, 3).
+    scale, offset
+        Factor and offset per PC coordinate, of shape (3,).
+    out
+        Array of shape (n, 3) to write the converted PCs into.
+
+    Returns
+    -------
+    out
+        PCs in the Bruker convention.
+    """
+    for i in nb.prange(pc.shape[0]):
+        for j in range(3):
+            out[i, j] = pc[i, j] / scale[j] + offset[j]
+    return out
+
+
+@nb.jit(
+    "float64[:, :](float64[:, :], float64[:, :])",
+    nogil=True,
+    nopython=True,
+    parallel=True,
+    cache=True,
+)
+def _pc_bruker2tsl(pc: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Convert PCs between the Bruker and the TSL convention by flipping
+    the y coordinate, which is its own inverse.
+
+    Parameters
+    ----------
+    pc
+        PCs in an array of shape (n, 3).
+    out
+        Array of shape (n, 3) to write the converted PCs into.
+
+    Returns
+    -------
+    out
+        PCs in the other convention.
+    """
+    for i in nb.prange(pc.shape[0]):
+        out[i, 0] = pc[i, 0]
+        out[i, 1] = 1 - pc[i, 1]
+        out[i, 2] = pc[i, 2]
+    return out
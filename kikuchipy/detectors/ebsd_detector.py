@@ -16,8 +16,8 @@
 # You should have received a copy of the GNU General Public License
 # along with kikuchipy. If not, see <http://www.gnu.org/licenses/>.
 
-from copy import deepcopy
-from typing import List, Optional, Tuple, Union
+from functools import wraps
+from typing import Callable, List, Optional, Tuple, Union
 
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
@@ -25,6 +25,53 @@ from matplotlib.markers import MarkerStyle
 import matplotlib.pyplot as plt
 import numpy as np
 
+from kikuchipy.detectors._detector_numba import (
+    NUMBA_MIN_NAVIGATION_SIZE,
+    _gnomonic_bounds,
+    _pc_bruker2emsoft as _pc_bruker2emsoft_numba,
+    _pc_bruker2tsl as _pc_bruker2tsl_numba,
+    _pc_emsoft2bruker as _pc_emsoft2bruker_numba,
+    _r_max,
+)
+
+
+# Aliases of recognised projection center (PC) conventions
+CONVENTION_ALIAS = {
+    "bruker": ["bruker"],
+    "tsl": ["tsl", "edax", "amatek"],
+    "oxford": ["oxford"],
+    "emsoft": ["emsoft", "emsoft4", "emsoft5"],
+}
+CONVENTION_ALIAS_ALL = frozenset(
+    alias for aliases in CONVENTION_ALIAS.values() for alias in aliases
+)
+# Map from each alias to the convention it is converted from, Oxford
+# being handled as TSL
+_CONVENTION_FROM_ALIAS = {
+    alias: "tsl" if convention == "oxford" else convention
+    for convention, aliases in CONVENTION_ALIAS.items()
+    for alias in aliases
+}
+
+# Default angular distances from the PC of circles drawn on the detector
+_DEFAULT_GNOMONIC_ANGLES = np.arange(1, 9, dtype=np.float64) * 10
+
+
+def _cached_property(func: Callable) -> property:
+    """Return a read-only property whose value is computed once and
+    stored in the instance's `_cache` until the cache is cleared.
+    """
+    key = func.__name__
+
+    @wraps(func)
+    def getter(self):
+        cache = self._cache
+        if key not in cache:
+            cache[key] = func(self)
+        return cache[key]
+
+    return property(getter)
+
 
 class EBSDDetector:
     """An EBSD detector class storing its shape, pixel size, binning
@@ -39,6 +86,18 @@ class EBSDDetector:
     :cite:`britton2016tutorial`.
     """
 
+    __slots__ = (
+        "_shape",
+        "_aspect_ratio",
+        "_px_size",
+        "_binning",
+        "tilt",
+        "azimuthal",
+        "sample_tilt",
+        "_pc",
+        "_cache",
+    )
+
     def __init__(
         self,
         shape: Tuple[int, int] = (1, 1),
@@ -110,9 +169,10 @@ class EBSDDetector:
         >>> det.bounds
         array([ 0, 59,  0, 59])
         >>> det.gnomonic_bounds[0, 0]
-        array([-0.83366337,  1.14653465, -0.83366337,  1.14653465])
+        array([-0.83366337,  1.14653465, -1.54257426,  0.43762376])
         >>> det.plot()
         """
+        self._cache = {}
         self.shape = shape
         self.px_size = px_size
         self.binning = binning
@@ -122,11 +182,33 @@ class EBSDDetector:
         self.pc = pc
         self._set_pc_convention(convention)
 
+    def __getstate__(self) -> dict:
+        # Cached properties are not carried over to copies or pickles
+        return {
+            name: getattr(self, name) for name in self.__slots__ if name != "_cache"
+        }
+
+    def __setstate__(self, state: dict):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._cache = {}
+
+    def __copy__(self) -> "EBSDDetector":
+        # Shallow copy sharing the PC array, with a new, empty cache
+        new = self.__class__.__new__(self.__class__)
+        new.__setstate__(self.__getstate__())
+        return new
+
+    def __deepcopy__(self, memo: dict) -> "EBSDDetector":
+        return self.deepcopy()
+
     def __repr__(self) -> str:
+        # Python floats are formatted without NumPy's scalar machinery
+        pc_average = tuple(self.pc_average.tolist())
         return (
             f"{self.__class__.__name__} {self.shape}, "
             f"px_size {self.px_size} um, binning {self.binning}, "
-            f"tilt {self.tilt}, azimuthal {self.azimuthal}, pc {tuple(self.pc_average)}"
+            f"tilt {self.tilt}, azimuthal {self.azimuthal}, pc {pc_average}"
         )
 
     @property
@@ -134,29 +216,82 @@ class EBSDDetector:
         """Specimen to scintillator distance (SSD), known in EMsoft as
         `L`.
         """
-        return self.pcz * self.height
+        return self._pc[..., 2] * self.height
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """Number of detector pixel rows and columns."""
+        return self._shape
+
+    @shape.setter
+    def shape(self, value: Tuple[int, int]):
+        """Set the number of detector pixel rows and columns.
+
+        Parameters
+        ----------
+        value
+            Number of detector rows and columns in pixels.
+        """
+        self._shape = tuple(value)
+        self._aspect_ratio = self._shape[0] / self._shape[1]
+        self._cache.clear()
+
+    @property
+    def px_size(self) -> float:
+        """Size of unbinned detector pixel in microns."""
+        return self._px_size
+
+    @px_size.setter
+    def px_size(self, value: float):
+        """Set the size of unbinned detector pixel in microns.
+
+        Parameters
+        ----------
+        value
+            Size of unbinned detector pixel in um, assuming a square
+            pixel shape.
+        """
+        self._px_size = value
+        self._cache.clear()
+
+    @property
+    def binning(self) -> int:
+        """Detector binning, i.e. how many pixels are binned into one."""
+        return self._binning
+
+    @binning.setter
+    def binning(self, value: int):
+        """Set the detector binning.
+
+        Parameters
+        ----------
+        value
+            Detector binning, i.e. how many pixels are binned into one.
+        """
+        self._binning = value
+        self._cache.clear()
 
     @property
     def nrows(self) -> int:
         """Number of detector pixel rows."""
-        return self.shape[0]
+        return self._shape[0]
 
     @property
     def ncols(self) -> int:
         """Number of detector pixel columns."""
-        return self.shape[1]
+        return self._shape[1]
 
-    @property
+    @_cached_property
     def size(self) -> int:
         """Number of detector pixels."""
         return self.nrows * self.ncols
 
-    @property
+    @_cached_property
     def height(self) -> float:
         """Detector height in microns."""
         return self.nrows * self.px_size * self.binning
 
-    @property
+    @_cached_property
     def width(self) -> float:
         """Detector width in microns."""
         return self.ncols * self.px_size * self.binning
@@ -164,14 +299,14 @@ class EBSDDetector:
     @property
     def aspect_ratio(self) -> float:
         """Number of detector rows divided by columns."""
-        return self.nrows / self.ncols
+        return self._aspect_ratio
 
-    @property
+    @_cached_property
     def unbinned_shape(self) -> Tuple[int, int]:
         """Unbinned detector shape in pixels."""
-        return tuple(np.array(self.shape) * self.binning)
+        return tuple(i * self.binning for i in self.shape)
 
-    @property
+    @_cached_property
     def px_size_binned(self) -> float:
         """Binned pixel size in microns."""
         return self.px_size * self.binning
@@ -183,7 +318,8 @@ class EBSDDetector:
 
     @pc.setter
     def pc(self, value: Union[np.ndarray, List, Tuple]):
-        """Set all projection center coordinates.
+        """Set all projection center coordinates, stored as a copy in
+        a C-contiguous array of 64-bit floats.
 
         Parameters
         ----------
@@ -192,12 +328,15 @@ class EBSDDetector:
             they are assumed to be on the form [[x0, y0, z0],
             [x1, y1, z1], ...]. Default is [[0.5, 0.5, 0.5]].
         """
-        self._pc = np.atleast_2d(value)
+        pc = np.array(value, dtype=np.float64, order="C")
+        if pc.ndim == 1:
+            pc = pc[np.newaxis, :]
+        self._pc = pc
 
     @property
     def pcx(self) -> np.ndarray:
         """Projection center x coordinates."""
-        return self.pc[..., 0]
+        return self._pc[..., 0]
 
     @pcx.setter
     def pcx(self, value: Union[np.ndarray, list, tuple, float]):
@@ -209,12 +348,12 @@ class EBSDDetector:
             Projection center x coordinates. If multiple x coordinates
             are passed, they are assumed to be on the form [x0, x1,...].
         """
-        self._pc[..., 0] = np.atleast_2d(value)
+        self._pc[..., 0] = value
 
     @property
     def pcy(self) -> np.ndarray:
         """Projection center y coordinates."""
-        return self.pc[..., 1]
+        return self._pc[..., 1]
 
     @pcy.setter
     def pcy(self, value: Union[np.ndarray, list, tuple, float]):
@@ -227,12 +366,12 @@ class EBSDDetector:
             Projection center y coordinates. If multiple y coordinates
             are passed, they are assumed to be on the form [y0, y1,...].
         """
-        self._pc[..., 1] = np.atleast_2d(value)
+        self._pc[..., 1] = value
 
     @property
     def pcz(self) -> np.ndarray:
         """Projection center z coordinates."""
-        return self.pc[..., 2]
+        return self._pc[..., 2]
 
     @pcz.setter
     def pcz(self, value: Union[np.ndarray, list, tuple, float]):
@@ -244,23 +383,20 @@ class EBSDDetector:
             Projection center z coordinates. If multiple z coordinates
             are passed, they are assumed to be on the form [z0, z1,...].
         """
-        self._pc[..., 2] = np.atleast_2d(value)
+        self._pc[..., 2] = value
 
     @property
     def pc_average(self) -> np.ndarray:
         """Return the overall average projection center."""
-        ndim = self.pc.ndim
-        axis = ()
-        if ndim == 2:
-            axis += (0,)
-        elif ndim == 3:
-            axis += (0, 1)
-        return np.nanmean(self.pc, axis=axis).round(3)
+        pc = self._pc
+        if pc.size == 3:
+            return pc.reshape(3).round(3)
+        return np.nanmean(pc, axis=tuple(range(pc.ndim - 1))).round(3)
 
     @property
     def navigation_shape(self) -> tuple:
         """Navigation shape of the projection center array."""
-        return self.pc.shape[: self.pc.ndim - 1]
+        return self._pc.shape[: self._pc.ndim - 1]
 
     @navigation_shape.setter
     def navigation_shape(self, value: tuple):
@@ -275,7 +411,12 @@ class EBSDDetector:
         if ndim > 2:
             raise ValueError(f"A maximum dimension of 2 is allowed, 2 < {ndim}")
         else:
-            self.pc = self.pc.reshape(value + (3,))
+            self.pc = self._pc.reshape(value + (3,))
+
+    @property
+    def navigation_size(self) -> int:
+        """Number of projection centers."""
+        return self._pc.size // 3
 
     @property
     def navigation_dimension(self) -> int:
@@ -284,47 +425,49 @@ class EBSDDetector:
         """
         return len(self.navigation_shape)
 
-    @property
+    @_cached_property
     def bounds(self) -> np.ndarray:
-        """Detector bounds [x0, x1, y0, y1] in pixel coordinates."""
-        return np.array([0, self.ncols - 1, 0, self.nrows - 1])
+        """Detector bounds [x0, x1, y0, y1] in pixel coordinates. The
+        returned array is read-only.
+        """
+        bounds = np.array([0, self.ncols - 1, 0, self.nrows - 1])
+        bounds.setflags(write=False)
+        return bounds
 
     @property
     def x_min(self) -> Union[np.ndarray, float]:
         """Left bound of detector in gnomonic coordinates."""
-        return -self.aspect_ratio * (self.pcx / self.pcz)
+        return self._x_bounds()[..., 0]
 
     @property
     def x_max(self) -> Union[np.ndarray, float]:
         """Right bound of detector in gnomonic coordinates."""
-        return self.aspect_ratio * (1 - self.pcx) / self.pcz
+        return self._x_bounds()[..., 1]
 
     @property
     def x_range(self) -> np.ndarray:
         """X detector limits in gnomonic coordinates."""
-        return np.dstack((self.x_min, self.x_max)).reshape(self.navigation_shape + (2,))
+        return self._x_bounds()
 
     @property
     def y_min(self) -> Union[np.ndarray, float]:
         """Top bound of detector in gnomonic coordinates."""
-        return -(1 - self.pcy) / self.pcz
+        return self._y_bounds()[..., 0]
 
     @property
     def y_max(self) -> Union[np.ndarray, float]:
         """Bottom bound of detector in gnomonic coordinates."""
-        return self.pcy / self.pcz
+        return self._y_bounds()[..., 1]
 
     @property
     def y_range(self) -> np.ndarray:
         """The y detector limits in gnomonic coordinates."""
-        return np.dstack((self.y_min, self.y_max)).reshape(self.navigation_shape + (2,))
+        return self._y_bounds()
 
     @property
     def gnomonic_bounds(self) -> np.ndarray:
         """Detector bounds [x0, x1, y0, y1] in gnomonic coordinates."""
-        return np.concatenate((self.x_range, self.y_range)).reshape(
-            self.navigation_shape + (4,)
-        )
+        return self._compute_gnomonic_bounds()
 
     @property
     def _average_gnomonic_bounds(self) -> np.ndarray:
@@ -335,34 +478,30 @@ class EBSDDetector:
     @property
     def x_scale(self) -> np.ndarray:
         """Width of a pixel in gnomonic coordinates."""
-        if self.ncols == 1:
-            x_scale = np.diff(self.x_range)
-        else:
-            x_scale = np.diff(self.x_range) / (self.ncols - 1)
-        return x_scale.reshape(self.navigation_shape)
+        return np.diff(self.x_range, axis=-1)[..., 0] / max(self.ncols - 1, 1)
 
     @property
     def y_scale(self) -> np.ndarray:
         """Height of a pixel in gnomonic coordinates."""
-        if self.nrows == 1:
-            y_scale = np.diff(self.y_range)
-        else:
-            y_scale = np.diff(self.y_range) / (self.nrows - 1)
-        return y_scale.reshape(self.navigation_shape)
+        return np.diff(self.y_range, axis=-1)[..., 0] / max(self.nrows - 1, 1)
 
     @property
     def r_max(self) -> np.ndarray:
         """Maximum distance from PC to detector edge in gnomonic
         coordinates.
         """
-        corners = np.zeros(self.navigation_shape + (4,))
-        corners[..., 0] = self.x_min ** 2 + self.y_min ** 2  # Up. left
-        corners[..., 1] = self.x_max ** 2 + self.y_min ** 2  # Up. right
-        corners[..., 2] = self.x_max ** 2 + self.y_max ** 2  # Lo. right
-        corners[..., 3] = self.x_min ** 2 + self.y_min ** 2  # Lo. left
-        return np.atleast_2d(np.sqrt(np.max(corners, axis=-1)))
-
-    def pc_emsoft(self, version: int = 5) -> np.ndarray:
+        if self.navigation_size >= NUMBA_MIN_NAVIGATION_SIZE:
+            r_max = _r_max(self._pc.reshape(-1, 3), self.aspect_ratio)
+            return np.atleast_2d(r_max.reshape(self.navigation_shape))
+        x_min, x_max, y_min, y_max = np.moveaxis(self._compute_gnomonic_bounds(), -1, 0)
+        # The furthest corner is furthest away in both x and y
+        x2 = np.maximum(x_min * x_min, x_max * x_max)
+        y2 = np.maximum(y_min * y_min, y_max * y_max)
+        return np.atleast_2d(np.sqrt(x2 + y2))
+
+    def pc_emsoft(
+        self, version: int = 5, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
         """Return PC in the EMsoft convention.
 
         PC conversions are calculated as presented in
@@ -375,8 +514,12 @@ class EBSDDetector:
             coordinate, `xpc`, flipped in version 5, because from then
             on the EBSD patterns were viewed looking from detector to
             sample, not the other way around.
+        out
+            Array of the same shape as :attr:`pc` to write the PCs
+            into, e.g. to reuse an array when converting many times. If
+            None (default), a new array is returned.
         """
-        return self._pc_bruker2emsoft(version=version)
+        return self._pc_bruker2emsoft(version=version, out=out)
 
     def pc_bruker(self) -> np.ndarray:
         """Return PC in the Bruker convention.
@@ -384,27 +527,51 @@ class EBSDDetector:
         PC conversions are calculated as presented in
         :cite:`jackson2019dictionary`..
         """
-        return self.pc
+        return self._pc
 
-    def pc_tsl(self) -> np.ndarray:
+    def pc_tsl(self, out: Optional[np.ndarray] = None) -> np.ndarray:
         """Return PC in the EDAX TSL convention.
 
         PC conversions are calculated as presented in
         :cite:`jackson2019dictionary`..
+
+        Parameters
+        ----------
+        out
+            Array of the same shape as :attr:`pc` to write the PCs
+            into, e.g. to reuse an array when converting many times. If
+            None (default), a new array is returned.
         """
-        return self._pc_bruker2tsl()
+        return self._pc_bruker2tsl(out=out)
 
-    def pc_oxford(self) -> np.ndarray:
+    def pc_oxford(self, out: Optional[np.ndarray] = None) -> np.ndarray:
         """Return PC in the Oxford convention.
 
         PC conversions are calculated as presented in
         :cite:`jackson2019dictionary`.
+
+        Parameters
+        ----------
+        out
+            Array of the same shape as :attr:`pc` to write the PCs
+            into, e.g. to reuse an array when converting many times. If
+            None (default), a new array is returned.
         """
-        return self._pc_bruker2tsl()
+        return self._pc_bruker2tsl(out=out)
 
     def deepcopy(self):
-        """Return a deep copy using :func:`copy.deepcopy`."""
-        return deepcopy(self)
+        """Return a deep copy of the detector with a copy of the
+        projection centers.
+        """
+        return self.__class__(
+            shape=self.shape,
+            px_size=self.px_size,
+            binning=self.binning,
+            tilt=self.tilt,
+            azimuthal=self.azimuthal,
+            sample_tilt=self.sample_tilt,
+            pc=self._pc,
+        )
 
     def plot(
         self,
@@ -418,6 +585,7 @@ class EBSDDetector:
         gnomonic_circles_kwargs: Optional[dict] = None,
         zoom: float = 1,
         return_fig_ax: bool = False,
+        ax: Optional[Axes] = None,
     ) -> Union[None, Tuple[Figure, Axes]]:
         """Plot the detector screen.
 
@@ -459,6 +627,9 @@ class EBSDDetector:
         return_fig_ax
             Whether to return the figure and axes object created.
             Default is False.
+        ax
+            An existing axes object to plot the detector in. If None
+            (default), a new figure with one axes is created.
 
         Returns
         -------
@@ -496,7 +667,7 @@ class EBSDDetector:
         if coordinates in [None, "detector"]:
             pcy *= sy
             pcx *= sx
-            bounds = self.bounds
+            bounds = self.bounds.copy()
             bounds[2:] = bounds[2:][::-1]
             x_label = "x detector"
             y_label = "y detector"
@@ -506,7 +677,10 @@ class EBSDDetector:
             x_label = "x gnomonic"
             y_label = "y gnomonic"
 
-        fig, ax = plt.subplots()
+        if ax is None:
+            fig, ax = plt.subplots()
+        else:
+            fig = ax.figure
         ax.axis(zoom * bounds)
         ax.set_aspect(self.aspect_ratio)
         ax.set_xlabel(x_label)
@@ -552,71 +726,164 @@ class EBSDDetector:
                 for k, v in default_params_gnomonic.items()
             ]
             if gnomonic_angles is None:
-                gnomonic_angles = np.arange(1, 9) * 10
-            for angle in gnomonic_angles:
-                ax.add_artist(
-                    plt.Circle(
-                        (pcx, pcy), np.tan(np.deg2rad(angle)), **gnomonic_circles_kwargs
-                    )
-                )
+                gnomonic_angles = _DEFAULT_GNOMONIC_ANGLES
+            radii = np.tan(np.deg2rad(gnomonic_angles))
+            for radius in radii:
+                ax.add_artist(plt.Circle((pcx, pcy), radius, **gnomonic_circles_kwargs))
 
         if return_fig_ax:
             return fig, ax
 
     # ------------------------ Private methods ----------------------- #
 
+    def _compute_gnomonic_bounds(self) -> np.ndarray:
+        """Return the detector bounds [x0, x1, y0, y1] in gnomonic
+        coordinates in one array of shape navigation shape + (4,).
+        """
+        pc = self._pc
+        nav_shape = self.navigation_shape
+        aspect_ratio = self.aspect_ratio
+        if self.navigation_size >= NUMBA_MIN_NAVIGATION_SIZE:
+            gnomonic_bounds = _gnomonic_bounds(pc.reshape(-1, 3), aspect_ratio)
+            return gnomonic_bounds.reshape(nav_shape + (4,))
+        return np.concatenate((self._x_bounds(), self._y_bounds()), axis=-1)
+
+    def _x_bounds(self) -> np.ndarray:
+        """Return the detector bounds [x0, x1] in gnomonic coordinates
+        in one array of shape navigation shape + (2,).
+        """
+        pc = self._pc
+        aspect_ratio = self.aspect_ratio
+        if pc.size == 3:
+            # Scalar arithmetic is faster for a single PC
+            pcx, _, pcz = pc.reshape(3)
+            x_bounds = np.array(
+                [-aspect_ratio * pcx / pcz, aspect_ratio * (1 - pcx) / pcz]
+            )
+            return x_bounds.reshape(pc.shape[:-1] + (2,))
+        pcx = pc[..., 0]
+        pcz = pc[..., 2]
+        x_bounds = np.empty(pc.shape[:-1] + (2,))
+        x_bounds[..., 0] = -aspect_ratio * pcx / pcz
+        x_bounds[..., 1] = aspect_ratio * (1 - pcx) / pcz
+        return x_bounds
+
+    def _y_bounds(self) -> np.ndarray:
+        """Return the detector bounds [y0, y1] in gnomonic coordinates
+        in one array of shape navigation shape + (2,).
+        """
+        pc = self._pc
+        if pc.size == 3:
+            # Scalar arithmetic is faster for a single PC
+            _, pcy, pcz = pc.reshape(3)
+            y_bounds = np.array([-(1 - pcy) / pcz, pcy / pcz])
+            return y_bounds.reshape(pc.shape[:-1] + (2,))
+        pcy = pc[..., 1]
+        pcz = pc[..., 2]
+        y_bounds = np.empty(pc.shape[:-1] + (2,))
+        y_bounds[..., 0] = -(1 - pcy) / pcz
+        y_bounds[..., 1] = pcy / pcz
+        return y_bounds
+
     def _set_pc_convention(self, convention: Optional[str] = None):
-        if convention is None or convention.lower() == "bruker":
-            pass
-        elif convention.lower() in ["tsl", "edax", "amatek"]:
-            self.pc = self._pc_tsl2bruker()
-        elif convention.lower() == "oxford":
-            self.pc = self._pc_tsl2bruker()
-        elif convention.lower() in ["emsoft", "emsoft4", "emsoft5"]:
+        if convention is None:
+            return
+        convention = convention.lower()
+        from_convention = _CONVENTION_FROM_ALIAS.get(convention)
+        if from_convention is None:
+            raise ValueError(
+                f"Projection center convention '{convention}' not among the "
+                f"recognised conventions {sorted(CONVENTION_ALIAS_ALL)}."
+            )
+        if from_convention == "tsl":
+            self._pc = self._pc_tsl2bruker()
+        elif from_convention == "emsoft":
             try:
                 version = int(convention[-1])
             except ValueError:
                 version = 5
-            self.pc = self._pc_emsoft2bruker(version=version)
-        else:
-            conventions = [
-                "bruker",
-                "emsoft",
-                "emsoft4",
-                "emsoft5",
-                "oxford",
-                "tsl",
-            ]
+            self._pc = self._pc_emsoft2bruker(version=version)
+
+    def _emsoft_pc_scale_offset(
+        self, version: int = 5
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the factors and offsets relating each coordinate of
+        EMsoft and Bruker PCs, so that
+        emsoft = (bruker - offset) * scale.
+        """
+        nrows, ncols = self._shape
+        binning = self._binning
+        nrows_binned = nrows * binning
+        xpc_scale = ncols * binning
+        if version == 5:
+            xpc_scale = -xpc_scale
+        scale = np.array(
+            [xpc_scale, -nrows_binned, nrows_binned * self._px_size], float
+        )
+        offset = np.array([0.5, 0.5, 0])
+        return scale, offset
+
+    def _use_numba_pc_conversion(self, out: Optional[np.ndarray] = None) -> bool:
+        """Whether to convert PCs with Numba, which is faster for many
+        PCs, given an optional array to write the result into.
+        """
+        if self.navigation_size < NUMBA_MIN_NAVIGATION_SIZE:
+            return False
+        return out is None or (out.dtype == np.float64 and out.flags.c_contiguous)
+
+    def _check_pc_out(self, out: Optional[np.ndarray] = None):
+        """Raise a ValueError if an array to write converted PCs into
+        does not have the same shape as the PC array.
+        """
+        if out is not None and out.shape != self._pc.shape:
             raise ValueError(
-                f"Projection center convention '{convention}' not among the "
-                f"recognised conventions {conventions}."
+                f"Output array shape {out.shape} must equal the projection "
+                f"center array shape {self._pc.shape}"
             )
 
     def _pc_emsoft2bruker(self, version: int = 5) -> np.ndarray:
-        new_pc = np.zeros_like(self.pc, dtype=np.float32)
-        if version == 5:
-            new_pc[..., 0] = 0.5 + (-self.pcx / (self.ncols * self.binning))
-        else:
-            new_pc[..., 0] = 0.5 + (self.pcx / (self.ncols * self.binning))
-        new_pc[..., 1] = 0.5 - (self.pcy / (self.nrows * self.binning))
-        new_pc[..., 2] = self.pcz / (self.nrows * self.px_size * self.binning)
+        scale, offset = self._emsoft_pc_scale_offset(version)
+        pc = self._pc
+        if self._use_numba_pc_conversion():
+            new_pc = np.empty_like(pc)
+            _pc_emsoft2bruker_numba(
+                pc.reshape(-1, 3), scale, offset, new_pc.reshape(-1, 3)
+            )
+            return new_pc
+        new_pc = pc / scale
+        new_pc += offset
         return new_pc
 
     def _pc_tsl2bruker(self) -> np.ndarray:
-        new_pc = deepcopy(self.pc)
-        new_pc[..., 1] = 1 - self.pcy
-        return new_pc
+        # Flipping the y coordinate is its own inverse
+        return self._pc_bruker2tsl()
 
-    def _pc_bruker2emsoft(self, version: int = 5) -> np.ndarray:
-        new_pc = np.zeros_like(self.pc, dtype=np.float32)
-        new_pc[..., 0] = self.ncols * (self.pcx - 0.5)
-        if version == 5:
-            new_pc[..., 0] = -new_pc[..., 0]
-        new_pc[..., 1] = self.nrows * (0.5 - self.pcy)
-        new_pc[..., 2] = self.nrows * self.px_size * self.pcz
-        return new_pc * self.binning
-
-    def _pc_bruker2tsl(self) -> np.ndarray:
-        new_pc = deepcopy(self.pc)
-        new_pc[..., 1] = 1 - self.pcy
-        return new_pc
+    def _pc_bruker2emsoft(
+        self, version: int = 5, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        self._check_pc_out(out)
+        scale, offset = self._emsoft_pc_scale_offset(version)
+        pc = self._pc
+        if self._use_numba_pc_conversion(out):
+            if out is None:
+                out = np.empty_like(pc)
+            _pc_bruker2emsoft_numba(
+                pc.reshape(-1, 3), scale, offset, out.reshape(-1, 3)
+            )
+            return out
+        out = np.subtract(pc, offset, out=out)
+        out *= scale
+        return out
+
+    def _pc_bruker2tsl(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        self._check_pc_out(out)
+        pc = self._pc
+        if out is None:
+            out = np.empty_like(pc)
+        if self._use_numba_pc_conversion(out):
+            _pc_bruker2tsl_numba(pc.reshape(-1, 3), out.reshape(-1, 3))
+            return out
+        out[..., 0] = pc[..., 0]
+        out[..., 1] = 1 - pc[..., 1]
+        out[..., 2] = pc[..., 2]
+        return out
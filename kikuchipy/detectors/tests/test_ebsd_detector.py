@@ -16,7 +16,9 @@
 # You should have received a copy of the GNU General Public License
 # along with kikuchipy. If not, see <http://www.gnu.org/licenses/>.
 
+import copy
 from copy import deepcopy
+import pickle
 
 import matplotlib.colors as mcolors
 import matplotlib.pyplot as plt
@@ -59,6 +61,31 @@ class TestEBSDDetector:
         """Initialize PC of valid types."""
         det = kp.detectors.EBSDDetector(pc=pc_type(pc1))
         assert isinstance(det.pc, np.ndarray)
+        assert det.pc.shape == (1, 3)
+        assert det.pc.dtype == np.float64
+
+    def test_pc_contiguous(self):
+        """PCs are stored in a C-contiguous array."""
+        pc = np.ones((3, 2, 3), dtype=np.float32).transpose((1, 0, 2))
+        det = kp.detectors.EBSDDetector(pc=pc)
+        assert det.pc.flags.c_contiguous
+        assert det.pc.dtype == np.float64
+        assert det.navigation_shape == (2, 3)
+
+    def test_pc_copied(self):
+        """PCs are stored in a copy of the passed array."""
+        pc = np.ones((2, 3, 3)) * 0.5
+        det = kp.detectors.EBSDDetector(pc=pc)
+        assert not np.shares_memory(det.pc, pc)
+        det2 = det.deepcopy()
+        assert not np.shares_memory(det2.pc, det.pc)
+
+    def test_set_pc_coordinate_scalar(self):
+        """Setting a PC coordinate to a scalar sets it for all PCs."""
+        det = kp.detectors.EBSDDetector(pc=np.ones((2, 3, 3), dtype=int))
+        det.pcz = 0.5
+        assert np.allclose(det.pcz, 0.5)
+        assert np.allclose(det.pcx, 1)
 
     @pytest.mark.parametrize(
         (
@@ -104,6 +131,31 @@ class TestEBSDDetector:
         assert detector.unbinned_shape == shape_unbinned
         assert detector.px_size_binned == px_size_binned
 
+    def test_detector_dimensions_updated(self):
+        """Derived values are updated when the shape, pixel size or
+        binning is changed.
+        """
+        detector = kp.detectors.EBSDDetector(shape=(60, 60), px_size=70, binning=8)
+        assert detector.height == 33600
+        assert np.allclose(detector.bounds, [0, 59, 0, 59])
+
+        detector.shape = (30, 60)
+        detector.px_size = 35
+        assert detector.height == 8400
+        assert detector.width == 16800
+        assert detector.aspect_ratio == 0.5
+        assert detector.size == 1800
+        assert np.allclose(detector.bounds, [0, 59, 0, 29])
+
+        detector.binning = 1
+        assert detector.unbinned_shape == (30, 60)
+        assert detector.px_size_binned == 35
+
+    def test_bounds_read_only(self, detector):
+        """Cached detector bounds cannot be modified in place."""
+        with pytest.raises(ValueError, match="assignment destination is read-only"):
+            detector.bounds[0] = 1
+
     def test_repr(self, pc1):
         """Expected string representation."""
         det = kp.detectors.EBSDDetector(
@@ -116,11 +168,56 @@ class TestEBSDDetector:
 
     def test_deepcopy(self, pc1):
         """Yields the expected parameters and an actual deep copy."""
-        detector1 = kp.detectors.EBSDDetector(pc=pc1)
+        detector1 = kp.detectors.EBSDDetector(
+            shape=(60, 80), px_size=70, binning=8, tilt=5, azimuthal=2, pc=pc1
+        )
         detector2 = detector1.deepcopy()
         detector1.pcx += 0.1
         assert np.allclose(detector1.pcx, 0.521)
         assert np.allclose(detector2.pcx, 0.421)
+        assert repr(detector2) == (
+            "EBSDDetector (60, 80), px_size 70 um, binning 8, tilt 5, azimuthal 2, pc "
+            "(0.421, 0.779, 0.505)"
+        )
+        assert detector2.sample_tilt == detector1.sample_tilt
+
+    def test_copy_module(self, pc1):
+        """copy.copy() shares the PCs with the original detector, while
+        copy.deepcopy() copies them.
+        """
+        detector1 = kp.detectors.EBSDDetector(
+            shape=(60, 80), px_size=70, binning=8, tilt=5, azimuthal=2, pc=pc1
+        )
+        detector2 = copy.copy(detector1)
+        detector3 = copy.deepcopy(detector1)
+        assert detector2.pc is detector1.pc
+        assert not np.shares_memory(detector3.pc, detector1.pc)
+        for detector in [detector2, detector3]:
+            assert isinstance(detector, kp.detectors.EBSDDetector)
+            assert repr(detector) == repr(detector1)
+            assert detector.sample_tilt == detector1.sample_tilt
+            assert detector._cache is not detector1._cache
+
+    @pytest.mark.parametrize(
+        "copy_func",
+        [copy.copy, copy.deepcopy, lambda x: pickle.loads(pickle.dumps(x))],
+    )
+    def test_copy_cache(self, copy_func):
+        """Cached properties are not shared with or carried over to a
+        copy of the detector.
+        """
+        detector1 = kp.detectors.EBSDDetector(shape=(60, 80), px_size=70, binning=8)
+        assert detector1.height == 33600
+        assert detector1.bounds[1] == 79
+        detector2 = copy_func(detector1)
+        detector2.shape = (30, 60)
+        assert detector2.height == 16800
+        assert np.allclose(detector2.bounds, [0, 59, 0, 29])
+        assert detector1.height == 33600
+        assert detector1.size == 4800
+        assert np.allclose(detector1.bounds, [0, 79, 0, 59])
+        with pytest.raises(ValueError, match="assignment destination is read-only"):
+            detector2.bounds[1] = 0
 
     def test_set_pc_coordinates(self, pc1):
         """Returns desired arrays with desired shapes."""
@@ -143,6 +240,8 @@ class TestEBSDDetector:
         "pc, desired_pc_average",
         [
             ([0.1234, 0.1235, 0.1234], [0.1230, 0.1240, 0.1230]),
+            ([[[0.1234, 0.1235, 0.1234]]], [0.1230, 0.1240, 0.1230]),
+            ([[0.1, 0.2, 0.3], [np.nan, np.nan, np.nan]], [0.1, 0.2, 0.3]),
             (np.arange(30).reshape((2, 5, 3)), [13.5, 14.5, 15.5]),
             (np.arange(30).reshape((10, 3)), [13.5, 14.5, 15.5]),
         ],
@@ -190,6 +289,58 @@ class TestEBSDDetector:
         assert np.allclose(detector.x_range, desired_x_range)
         assert np.allclose(detector.y_range, desired_y_range)
 
+    def test_gnomonic_bounds_multiple_pcs(self):
+        """Gnomonic bounds of each PC are [x0, x1, y0, y1]."""
+        pc = np.random.random((2, 3, 3)) * 0.5 + 0.25
+        detector = kp.detectors.EBSDDetector(shape=(60, 80), pc=pc)
+        gnomonic_bounds = detector.gnomonic_bounds
+        assert gnomonic_bounds.shape == (2, 3, 4)
+        assert np.allclose(gnomonic_bounds[..., 0], detector.x_min)
+        assert np.allclose(gnomonic_bounds[..., 1], detector.x_max)
+        assert np.allclose(gnomonic_bounds[..., 2], detector.y_min)
+        assert np.allclose(gnomonic_bounds[..., 3], detector.y_max)
+
+    @pytest.mark.parametrize(
+        "pc",
+        [
+            [0.5, 0.5, 0.5],
+            [0.8, 0.2, 0.6],
+            [0.2, 0.8, 0.6],
+            [0.3, 0.1, 0.4],
+            [0.8, 0.8, 0.6],
+        ],
+    )
+    def test_r_max(self, pc):
+        """Maximum distance from the PC to all four detector corners."""
+        detector = kp.detectors.EBSDDetector(shape=(60, 80), pc=pc)
+        x = np.array([detector.x_min, detector.x_max])
+        y = np.array([detector.y_min, detector.y_max])
+        corners = x[:, np.newaxis] ** 2 + y[np.newaxis, :] ** 2
+        assert np.allclose(detector.r_max, np.sqrt(corners.max()))
+
+    def test_gnomonic_bounds_r_max_many_pcs(self):
+        """Gnomonic bounds and maximum distance from PC to detector
+        corners are the same when computed with Numba for many PCs.
+        """
+        nav_shape = (40, 30)
+        pc = np.random.random(nav_shape + (3,)) * 0.5 + 0.25
+        pc[0, 0] = np.nan
+        detector = kp.detectors.EBSDDetector(shape=(60, 80), pc=pc)
+        assert detector.navigation_size == 1200
+
+        gnomonic_bounds = detector.gnomonic_bounds
+        assert gnomonic_bounds.shape == nav_shape + (4,)
+        desired_gnomonic_bounds = np.stack(
+            [detector.x_min, detector.x_max, detector.y_min, detector.y_max], axis=-1
+        )
+        assert np.allclose(gnomonic_bounds, desired_gnomonic_bounds, equal_nan=True)
+
+        r_max = detector.r_max
+        assert r_max.shape == nav_shape
+        assert np.isnan(r_max[0, 0])
+        detector_small = kp.detectors.EBSDDetector(shape=(60, 80), pc=pc[1:, 1:])
+        assert np.allclose(r_max[1:, 1:], detector_small.r_max)
+
     @pytest.mark.parametrize(
         "shape, desired_x_scale, desired_y_scale",
         [
@@ -312,6 +463,59 @@ class TestEBSDDetector:
             kp.detectors.EBSDDetector(pc=det.pc_tsl(), convention="tsl").pc_tsl(), pc
         )
 
+    def test_pc_conversion_out(self):
+        """PCs in other conventions can be written to an existing array."""
+        pc = np.random.random((2, 3, 3))
+        det = kp.detectors.EBSDDetector(shape=(60, 80), px_size=70, binning=8, pc=pc)
+        out = np.zeros_like(pc)
+
+        pc_emsoft = det.pc_emsoft(version=4, out=out)
+        assert pc_emsoft is out
+        assert np.allclose(out, det.pc_emsoft(version=4))
+        assert np.allclose(det.pc, pc)
+
+        pc_tsl = det.pc_tsl(out=out)
+        assert pc_tsl is out
+        assert np.allclose(out[..., 1], 1 - pc[..., 1])
+        assert np.allclose(det.pc_oxford(out=out), det.pc_tsl())
+
+    @pytest.mark.parametrize("nav_shape", [(5,), (40, 30)])
+    def test_pc_conversion_out_raises(self, nav_shape):
+        """PCs cannot be written to an array of another shape."""
+        det = kp.detectors.EBSDDetector(pc=np.ones(nav_shape + (3,)) * 0.5)
+        out = np.zeros((2,) + nav_shape + (3,))
+        with pytest.raises(ValueError, match="Output array shape "):
+            det.pc_tsl(out=out)
+        with pytest.raises(ValueError, match="Output array shape "):
+            det.pc_oxford(out=out)
+        with pytest.raises(ValueError, match="Output array shape "):
+            det.pc_emsoft(out=out)
+
+    def test_pc_conversion_many_pcs(self):
+        """PC conversions are the same when computed with Numba for many
+        PCs.
+        """
+        pc = np.random.random((40, 30, 3)) * 0.5 + 0.25
+        det_kw = dict(shape=(60, 80), px_size=70, binning=8)
+        det = kp.detectors.EBSDDetector(pc=pc, **det_kw)
+        det_small = kp.detectors.EBSDDetector(pc=pc[:2, :3], **det_kw)
+        assert det.navigation_size == 1200
+
+        for version in [4, 5]:
+            pc_emsoft = det.pc_emsoft(version=version)
+            assert np.allclose(pc_emsoft[:2, :3], det_small.pc_emsoft(version))
+            det2 = kp.detectors.EBSDDetector(
+                pc=pc_emsoft, convention=f"emsoft{version}", **det_kw
+            )
+            assert np.allclose(det2.pc, pc)
+
+        out = np.zeros_like(pc)
+        pc_tsl = det.pc_tsl(out=out)
+        assert pc_tsl is out
+        assert np.allclose(pc_tsl[:2, :3], det_small.pc_tsl())
+        det3 = kp.detectors.EBSDDetector(pc=pc_tsl, convention="tsl", **det_kw)
+        assert np.allclose(det3.pc, pc)
+
     @pytest.mark.parametrize(
         "pc, convention",
         [
@@ -425,6 +629,16 @@ class TestEBSDDetector:
         )
         plt.close("all")
 
+    def test_plot_existing_axes(self, detector):
+        """Plot the detector in an existing axes."""
+        fig, axes = plt.subplots(ncols=2)
+        fig2, ax2 = detector.plot(ax=axes[1], return_fig_ax=True)
+        assert fig2 is fig
+        assert ax2 is axes[1]
+        assert ax2.get_xlabel() == "x detector"
+        assert axes[0].get_xlabel() == ""
+        plt.close("all")
+
     @pytest.mark.parametrize("coordinates", ["detector", "gnomonic"])
     def test_plot_extent(self, detector, coordinates):
         """Correct detector extent."""